@@ -19,12 +19,17 @@
 # <pep8 compliant>
 
 import bpy
-from bpy.props import BoolProperty, EnumProperty, PointerProperty
-from bpy.types import AddonPreferences, GizmoGroup, Operator, Scene
+from bpy.props import (BoolProperty, CollectionProperty, EnumProperty,
+                       IntProperty, PointerProperty, StringProperty)
+from bpy.types import (AddonPreferences, GizmoGroup, IMAGE_HT_header, Operator,
+                       Panel, PropertyGroup, Scene)
 from bpy.utils import register_class, unregister_class
 
+from .modules import (image_proxy, mesh_revision, profiler, sticky_areas,
+                      uv_framing, uv_statistics)
 from .modules.keymap_manager import (draw_key, register_keymap,
                                      unregister_keymap)
+from .modules.udim_grid import get_tile_grid_shape
 from .uv_editor_settings import UVEditorSettings
 
 bl_info = {
@@ -41,6 +46,27 @@ bl_info = {
 }
 
 
+def update_profiling(self, context):
+    if self.use_profiling:
+        targets = [(StickyUVEditor, "invoke"),
+                   (UVEditorSettings, "set"),
+                   (UVEditorSettings, "save_from_area"),
+                   (StickyUVEditor_UI_Button, "draw_prepare")]
+        profiler.start_session(targets, self.profiling_limit_type,
+                               self.profiling_limit, finish_profiling)
+    else:
+        filepath = profiler.stop_session(
+            bpy.path.abspath(self.profiling_directory))
+
+        if filepath is not None:
+            self.profiling_output = filepath
+
+
+def finish_profiling():
+    addon_prefs = bpy.context.preferences.addons[__name__].preferences
+    addon_prefs.use_profiling = False
+
+
 class AddonPreferences(AddonPreferences):
     bl_idname = __name__
 
@@ -71,8 +97,56 @@ class AddonPreferences(AddonPreferences):
         name="Remember UV Editor Settings",
         description="Remember changes made in UV Editor area",
         default=True)
+    show_material_image: BoolProperty(
+        name="Show Material Image",
+        description="Show image of the active object material in UV Editor",
+        default=False)
+    use_image_proxy: BoolProperty(
+        name="Use Image Proxy",
+        description="Show downscaled copy of large images until full resolution is requested",
+        default=True)
+    image_proxy_size: IntProperty(
+        name="Proxy Size",
+        description="Maximum width and height of image proxy in pixels",
+        default=1024,
+        min=128, max=8192)
+    show_uv_statistics: BoolProperty(
+        name="Show UV Statistics",
+        description="Show island count, UV coverage and texel density in UV Editor sidebar",
+        default=False)
     uv_editor_settings: PointerProperty(type=UVEditorSettings)
 
+    use_profiling: BoolProperty(
+        name="Profile",
+        description="Profile add-on operator and overlay button until the limit is reached",
+        default=False,
+        options={'SKIP_SAVE'},
+        update=update_profiling)
+    profiling_limit_type: EnumProperty(
+        name="Limit",
+        description="How long to profile",
+        items={('CALLS', "Calls",
+                "Stop after a number of calls", 0),
+               ('SECONDS', "Seconds",
+                "Stop after a number of seconds", 1)},
+        default='CALLS')
+    profiling_limit: IntProperty(
+        name="Count",
+        description="Number of calls or seconds to profile",
+        default=100,
+        min=1)
+    profiling_directory: StringProperty(
+        name="Directory",
+        description="Folder to save profiles to (system temporary folder if empty)",
+        subtype='DIR_PATH',
+        default="")
+    profiling_output: StringProperty(
+        name="Last Profile",
+        description="Profile saved by the last profiling session",
+        subtype='FILE_PATH',
+        default="",
+        options={'SKIP_SAVE'})
+
     view_mode: EnumProperty(
         name="View Mode",
         description="Adjust UV Editor view when open",
@@ -85,6 +159,10 @@ class AddonPreferences(AddonPreferences):
                ('FRAME_ALL_FIT', "Frame All UDIMs",
                 "View all UDIMs", 3)},
         default='DISABLE')
+    use_auto_tile_grid: BoolProperty(
+        name="Auto UDIM Grid",
+        description="Fit UDIM grid shape to tiles occupied by UVs of objects in Edit Mode",
+        default=False)
     use_uv_select_sync: BoolProperty(
         name="UV Sync Selection",
         description="Keep UV an edit mode mesh selection in sync",
@@ -104,6 +182,16 @@ class AddonPreferences(AddonPreferences):
             col.prop(self, "uv_editor_side")
             col.prop(self, "show_ui_button")
             col.prop(self, "remember_uv_editor_settings")
+            col.prop(self, "show_material_image")
+
+            row = col.row()
+            row.active = self.show_material_image
+            row.prop(self, "use_image_proxy")
+            sub = row.row()
+            sub.active = self.use_image_proxy
+            sub.prop(self, "image_proxy_size")
+            col.prop(self, "show_uv_statistics")
+            col.operator("wm.sticky_uv_editor_audit")
 
             box = layout.box()
             split = box.split()
@@ -113,6 +201,21 @@ class AddonPreferences(AddonPreferences):
 
             col.prop(self, "use_uv_select_sync")
 
+            box = layout.box()
+            split = box.split()
+            col = split.column()
+            col.label(text="Profiling:")
+            col.separator()
+
+            row = col.row()
+            row.prop(self, "use_profiling")
+            row.prop(self, "profiling_limit_type", text="")
+            row.prop(self, "profiling_limit")
+            col.prop(self, "profiling_directory")
+
+            if self.profiling_output:
+                col.prop(self, "profiling_output")
+
         if self.settings_tabs == 'OVERLAY':
             box = layout.box()
             split = box.split()
@@ -138,7 +241,10 @@ class AddonPreferences(AddonPreferences):
             col.separator()
 
             col.label(text="View")
-            col.prop(self.uv_editor_settings, "tile_grid_shape")
+            col.prop(self, "use_auto_tile_grid")
+            row = col.row()
+            row.active = not self.use_auto_tile_grid
+            row.prop(self.uv_editor_settings, "tile_grid_shape")
             col.prop(self.uv_editor_settings, "use_custom_grid")
             col.prop(self.uv_editor_settings, "custom_grid_subdivisions")
 
@@ -222,6 +328,7 @@ Hold 'Alt' to open UV Editor in a separate window."""
                                     # Save UV Editor area settings
                                     scene.uv_editor_settings.save_from_area(
                                         active_area)
+                                    sticky_areas.untag_area(active_area)
 
                                     # Close UV Editor area
                                     if app_version >= (3, 0, 0):
@@ -247,6 +354,7 @@ Hold 'Alt' to open UV Editor in a separate window."""
                                     # Save UV Editor area settings
                                     scene.uv_editor_settings.save_from_area(
                                         active_area)
+                                    sticky_areas.untag_area(active_area)
 
                                     # Close UV Editor area
                                     if app_version >= (3, 0, 0):
@@ -282,6 +390,7 @@ Hold 'Alt' to open UV Editor in a separate window."""
                                     # Save UV Editor area settings
                                     scene.uv_editor_settings.save_from_area(
                                         area)
+                                    sticky_areas.untag_area(area)
 
                                     # Close UV Editor area
                                     if app_version >= (3, 0, 0):
@@ -305,6 +414,7 @@ Hold 'Alt' to open UV Editor in a separate window."""
                                     # Save UV Editor area settings
                                     scene.uv_editor_settings.save_from_area(
                                         area)
+                                    sticky_areas.untag_area(area)
 
                                     # Close UV Editor area
                                     if app_version >= (3, 0, 0):
@@ -348,6 +458,8 @@ Hold 'Alt' to open UV Editor in a separate window."""
 
         ui_type = active_area.ui_type
         uv_area.ui_type = 'UV'
+        sticky_areas.prune(context.window_manager)
+        sticky_areas.tag_area(uv_area)
 
         # Set UV Editor area settings
         uv_editor_settings = scene.uv_editor_settings
@@ -362,6 +474,23 @@ Hold 'Alt' to open UV Editor in a separate window."""
 
         uv_editor_settings.set(uv_area)
 
+        # Fit UDIM grid to UVs
+        if addon_prefs.use_auto_tile_grid and \
+                (context.mode == 'EDIT_MESH'):
+            uv_area.spaces[0].uv_editor.tile_grid_shape = \
+                get_tile_grid_shape(context.objects_in_mode_unique_data)
+
+        # Collect UV statistics in background
+        if addon_prefs.show_uv_statistics and (context.mode == 'EDIT_MESH'):
+            uv_statistics.request_statistics(context.active_object)
+
+        # Show active material image
+        if addon_prefs.show_material_image:
+            proxy_size = addon_prefs.image_proxy_size \
+                if addon_prefs.use_image_proxy else 0
+            image_proxy.show_material_image(
+                context.active_object, uv_area, proxy_size)
+
         # Set view mode
         view_mode = addon_prefs.view_mode
 
@@ -372,15 +501,212 @@ Hold 'Alt' to open UV Editor in a separate window."""
             if view_mode == 'FRAME_ALL':
                 bpy.ops.image.view_all(override)
             elif view_mode == 'FRAME_SELECTED':
-                bpy.ops.image.view_selected(override)
+                uv_framing.frame_selected(
+                    context, uv_area, context.objects_in_mode_unique_data)
             elif view_mode == 'FRAME_ALL_FIT':
                 bpy.ops.image.view_all(override, fit_view=True)
 
         # Open UV Editor in new window
         if event.alt:
+            window_pointers = {window.as_pointer()
+                               for window in context.window_manager.windows}
             bpy.ops.screen.area_dupli('INVOKE_DEFAULT')
             active_area.ui_type = ui_type
+            sticky_areas.untag_area(active_area)
+
+            for window in context.window_manager.windows:
+                if window.as_pointer() not in window_pointers:
+                    sticky_areas.tag_window(window)
+
+                    for area in window.screen.areas:
+                        sticky_areas.tag_area(area)
+
+                        if area.ui_type == 'UV':
+                            image_proxy.retarget_area(uv_area, area)
+
+        return {'FINISHED'}
+
 
+class StickyUVEditor_FullImage(Operator):
+    """Replace image proxy with full resolution image"""
+    bl_idname = "wm.sticky_uv_editor_full_image"
+    bl_label = "Load Full Resolution"
+    bl_options = {'INTERNAL'}
+
+    @classmethod
+    def poll(self, context):
+        space = context.space_data
+
+        if (space is None) or (space.type != 'IMAGE_EDITOR'):
+            return False
+
+        return image_proxy.get_source_image(space.image) is not None
+
+    def execute(self, context):
+        space = context.space_data
+        space.image = image_proxy.get_source_image(space.image)
+        return {'FINISHED'}
+
+
+class StickyUVEditor_Statistics(Operator):
+    """Collect UV statistics of the active object"""
+    bl_idname = "wm.sticky_uv_editor_statistics"
+    bl_label = "Refresh UV Statistics"
+    bl_options = {'INTERNAL'}
+
+    @classmethod
+    def poll(self, context):
+        return context.mode == 'EDIT_MESH'
+
+    def execute(self, context):
+        uv_statistics.request_statistics(context.active_object, force=True)
+        return {'FINISHED'}
+
+
+class StickyUVEditor_PT_Statistics(Panel):
+    bl_idname = "StickyUVEditor_PT_Statistics"
+    bl_label = "UV Statistics"
+    bl_space_type = 'IMAGE_EDITOR'
+    bl_region_type = 'UI'
+    bl_category = "Sticky UV Editor"
+
+    @classmethod
+    def poll(cls, context):
+        addon_prefs = context.preferences.addons[__name__].preferences
+        return addon_prefs.show_uv_statistics and \
+            (context.mode == 'EDIT_MESH') and \
+            sticky_areas.is_sticky_area(context.area)
+
+    def draw(self, context):
+        layout = self.layout
+        mesh = context.active_object.data
+        statistics, is_current = uv_statistics.get_statistics(mesh)
+
+        row = layout.row()
+
+        if uv_statistics.is_pending(mesh):
+            row.label(text="Computing...")
+        elif (statistics is not None) and (not is_current):
+            row.label(text="Outdated", icon='ERROR')
+
+        row.operator("wm.sticky_uv_editor_statistics", text="",
+                     icon='FILE_REFRESH')
+
+        if statistics is None:
+            return
+
+        # Texel density for the shown image, loaded images only
+        image_size = image_proxy.get_image_size(context.space_data.image)
+        texture_size = max(image_size) if image_size else 1024
+
+        col = layout.column(align=True)
+        col.label(text="Islands: %d" % statistics["islands"])
+        col.label(text="UV Coverage: %.1f%%" % (statistics["coverage"] * 100))
+        # Sum of face UV areas, overlaps and other tiles included
+        col.label(text="UV Area: %.1f%%" % (statistics["uv_area"] * 100))
+        col.separator()
+
+        col.label(text="Texel Density (%d px):" % texture_size)
+        col.label(text="Min: %.2f px/m" %
+                  (statistics["density_min"] * texture_size))
+        col.label(text="Mean: %.2f px/m" %
+                  (statistics["density_mean"] * texture_size))
+        col.label(text="Max: %.2f px/m" %
+                  (statistics["density_max"] * texture_size))
+
+
+class StickyUVEditor_AuditItem(PropertyGroup):
+    pointer: StringProperty()
+    is_window: BoolProperty()
+    is_orphan: BoolProperty()
+    close: BoolProperty(
+        name="Close",
+        description="Close this UV Editor",
+        default=False)
+
+
+class StickyUVEditor_Audit(Operator):
+    """Close UV Editor windows and areas left behind by Sticky UV Editor"""
+    bl_idname = "wm.sticky_uv_editor_audit"
+    bl_label = "Reclaim Sticky UV Editors"
+    bl_options = {'INTERNAL'}
+
+    editors: CollectionProperty(type=StickyUVEditor_AuditItem)
+
+    def invoke(self, context, event):
+        # Areas can be closed by operator since 3.0 only
+        editors = sticky_areas.collect_editors(
+            context.window_manager, bpy.app.version >= (3, 0, 0))
+        self.editors.clear()
+
+        for window, area, age, size, is_orphan in editors:
+            item = self.editors.add()
+            item.is_window = area is None
+            item.pointer = str(
+                window.as_pointer() if area is None else area.as_pointer())
+            item.is_orphan = is_orphan
+            item.close = is_orphan
+            item.name = "%s: %d x %d, %d min, " \
+                "draw buffers ~%.1f MB (rough)" % (
+                "Window" if area is None else "Area",
+                window.width if area is None else area.width,
+                window.height if area is None else area.height,
+                age // 60, size / 1048576)
+
+        return context.window_manager.invoke_props_dialog(self, width=400)
+
+    def draw(self, context):
+        layout = self.layout
+
+        if len(self.editors) == 0:
+            layout.label(text="Nothing to reclaim")
+            return
+
+        for label, is_orphan in (("Left Behind:", True),
+                                 ("Add-on Windows:", False)):
+            items = [item for item in self.editors
+                     if item.is_orphan == is_orphan]
+
+            if not items:
+                continue
+
+            col = layout.column(align=True)
+            col.label(text=label)
+
+            for item in items:
+                col.prop(item, "close", text=item.name)
+
+    def execute(self, context):
+        window_manager = context.window_manager
+        scene = context.scene
+        reclaimed = 0
+
+        for item in self.editors:
+            if not item.close:
+                continue
+
+            if item.is_window:
+                window = sticky_areas.find_window(
+                    window_manager, int(item.pointer))
+
+                if window is not None:
+                    bpy.ops.wm.window_close({"window": window})
+                    reclaimed += 1
+            else:
+                window, area = sticky_areas.find_area(
+                    window_manager, int(item.pointer))
+
+                if area is not None:
+                    scene.uv_editor_settings.save_from_area(area)
+                    sticky_areas.untag_area(area)
+                    bpy.ops.screen.area_close(
+                        {"window": window, "screen": window.screen,
+                         "area": area})
+                    reclaimed += 1
+
+        sticky_areas.prune(window_manager)
+        self.report({'INFO'}, "Sticky UV Editor: Closed %d editors" %
+                    reclaimed)
         return {'FINISHED'}
 
 
@@ -443,6 +769,11 @@ classes = (
     UVEditorSettings,
     AddonPreferences,
     StickyUVEditor,
+    StickyUVEditor_FullImage,
+    StickyUVEditor_Statistics,
+    StickyUVEditor_PT_Statistics,
+    StickyUVEditor_AuditItem,
+    StickyUVEditor_Audit,
     StickyUVEditor_UI_Button
 )
 
@@ -452,18 +783,40 @@ def sticky_uv_editor_button(self, context):
     layout.operator("wm.sticky_uv_editor", text="", icon='UV')
 
 
+def full_image_button(self, context):
+    space = context.space_data
+
+    if image_proxy.get_source_image(space.image) is not None:
+        layout = self.layout
+        layout.operator("wm.sticky_uv_editor_full_image", icon='IMAGE_DATA')
+
+
 def register():
     for cls in classes:
         register_class(cls)
 
     Scene.uv_editor_settings = PointerProperty(type=UVEditorSettings)
+    IMAGE_HT_header.append(full_image_button)
+    mesh_revision.register_handlers()
     register_keymap()
 
+    # Profiling session does not survive restart
+    addon = bpy.context.preferences.addons.get(__name__)
+
+    if addon is not None:
+        addon.preferences.use_profiling = False
+
 
 def unregister():
     for cls in classes:
         unregister_class(cls)
 
+    IMAGE_HT_header.remove(full_image_button)
+    mesh_revision.unregister_handlers()
+    image_proxy.unregister()
+    uv_statistics.unregister()
+    uv_framing.unregister()
+    profiler.stop_session()
     unregister_keymap()
 
 
@@ -0,0 +1,296 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+import hashlib
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import bpy
+
+SOURCE_IMAGE_KEY = "sticky_uv_editor_source"
+SOURCE_SIZE_KEY = "sticky_uv_editor_source_size"
+
+# Decoding runs in a separate Blender process,
+# imbuf holds the GIL and would block the UI for the whole decode
+PROXY_SCRIPT = """
+import os
+import sys
+
+import imbuf
+
+filepath, proxy_path, size = sys.argv[sys.argv.index("--") + 1:]
+size = int(size)
+ibuf = imbuf.load(filepath)
+width, height = ibuf.size
+
+if max(width, height) > size:
+    scale = size / max(width, height)
+    ibuf.resize((max(1, int(width * scale)), max(1, int(height * scale))),
+                method='BILINEAR')
+
+    # Older ImBuf API keeps source format, loading detects it anyway
+    if hasattr(ibuf, "file_type"):
+        ibuf.file_type = 'PNG'
+
+    os.makedirs(os.path.dirname(proxy_path), exist_ok=True)
+
+    with open(proxy_path + ".size", "w") as file:
+        file.write("%d %d" % (width, height))
+
+    temp_path = proxy_path + ".tmp"
+    imbuf.write(ibuf, filepath=temp_path)
+    os.replace(temp_path, proxy_path)
+    print("STICKY_UV_EDITOR_PROXY WRITTEN")
+else:
+    print("STICKY_UV_EDITOR_PROXY SMALL")
+
+ibuf.free()
+"""
+
+# Material pointer -> name of the image texture node to show
+image_nodes = {}
+
+# Proxy file path -> pending proxy generation
+pending_proxies = {}
+
+# Source files which are already small enough to be shown as is
+small_images = set()
+
+# Timers waiting for pending proxies
+proxy_timers = set()
+
+# Area pointer -> pointer of area the pending proxy should be shown in
+area_targets = {}
+
+executor = None
+
+
+def get_executor():
+    global executor
+
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=1)
+
+    return executor
+
+
+def unregister():
+    global executor
+
+    for timer in proxy_timers:
+        if bpy.app.timers.is_registered(timer):
+            bpy.app.timers.unregister(timer)
+
+    proxy_timers.clear()
+    pending_proxies.clear()
+    area_targets.clear()
+
+    if executor is not None:
+        executor.shutdown(wait=False)
+        executor = None
+
+
+def get_material_image(material):
+    if (material is None) or (material.use_nodes is False):
+        return None
+
+    nodes = material.node_tree.nodes
+
+    # Active image texture node is the one used for painting and baking
+    active_node = nodes.active
+
+    if (active_node is not None) and (active_node.type == 'TEX_IMAGE') and \
+            (active_node.image is not None):
+        return active_node.image
+
+    key = material.as_pointer()
+    node = nodes.get(image_nodes.get(key, ""))
+
+    if (node is None) or (node.type != 'TEX_IMAGE') or (node.image is None):
+        node = None
+
+        for material_node in nodes:
+            if (material_node.type == 'TEX_IMAGE') and \
+                    (material_node.image is not None):
+                node = material_node
+                break
+
+        if node is None:
+            image_nodes.pop(key, None)
+            return None
+
+        image_nodes[key] = node.name
+
+    return node.image
+
+
+def get_cache_directory():
+    return os.path.join(bpy.utils.user_resource('DATAFILES'),
+                        "sticky_uv_editor", "proxies")
+
+
+def get_proxy_path(filepath, size):
+    stat = os.stat(filepath)
+    key = "%s|%d|%d|%d" % (filepath, stat.st_mtime_ns, stat.st_size, size)
+
+    return os.path.join(get_cache_directory(),
+                        hashlib.sha1(key.encode()).hexdigest() + ".png")
+
+
+def generate_proxy(binary_path, filepath, proxy_path, size):
+    # Runs in worker thread, must not touch bpy data
+    result = subprocess.run(
+        [binary_path, "--background", "--factory-startup",
+         "--python-expr", PROXY_SCRIPT, "--",
+         filepath, proxy_path, str(size)],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        universal_newlines=True, check=True)
+
+    if "STICKY_UV_EDITOR_PROXY SMALL" in result.stdout:
+        return None
+
+    if not os.path.isfile(proxy_path):
+        raise RuntimeError("Failed to generate proxy for " + filepath)
+
+    return proxy_path
+
+
+def load_proxy(image, proxy_path):
+    proxy = bpy.data.images.load(proxy_path, check_existing=True)
+    proxy.name = image.name + " (Proxy)"
+    proxy.colorspace_settings.name = image.colorspace_settings.name
+    proxy.alpha_mode = image.alpha_mode
+    proxy[SOURCE_IMAGE_KEY] = image.name
+
+    # Resolution of source image, reading its size would load it
+    try:
+        with open(proxy_path + ".size") as file:
+            proxy[SOURCE_SIZE_KEY] = [int(value)
+                                      for value in file.read().split()]
+    except (OSError, ValueError):
+        pass
+
+    return proxy
+
+
+def get_source_image(image):
+    if (image is None) or (SOURCE_IMAGE_KEY not in image):
+        return None
+
+    return bpy.data.images.get(image[SOURCE_IMAGE_KEY])
+
+
+def get_image_size(image):
+    # Size of image or of source image for proxies, without loading it
+    if image is None:
+        return None
+
+    if SOURCE_SIZE_KEY in image:
+        return tuple(image[SOURCE_SIZE_KEY])
+
+    if image.has_data:
+        return tuple(image.size)
+
+    return None
+
+
+def find_space(area_pointer):
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.as_pointer() == area_pointer:
+                return area.spaces[0] if area.ui_type == 'UV' else None
+
+    return None
+
+
+def retarget_area(area, target_area):
+    # Pending proxy follows UV Editor moved to another area
+    if pending_proxies:
+        area_targets[area.as_pointer()] = target_area.as_pointer()
+
+
+def show_material_image(obj, area, proxy_size):
+    if obj is None:
+        return
+
+    image = get_material_image(obj.active_material)
+
+    if image is None:
+        return
+
+    space = area.spaces[0]
+
+    # Use image as is if it is already in memory or cannot be proxied
+    if (proxy_size == 0) or image.has_data or (image.source != 'FILE') or \
+            (image.packed_file is not None):
+        space.image = image
+        return
+
+    filepath = bpy.path.abspath(image.filepath, library=image.library)
+
+    if (not os.path.isfile(filepath)) or (filepath in small_images):
+        space.image = image
+        return
+
+    proxy_path = get_proxy_path(filepath, proxy_size)
+
+    # Proxies without source size come from older versions, regenerate
+    if os.path.isfile(proxy_path) and os.path.isfile(proxy_path + ".size"):
+        space.image = load_proxy(image, proxy_path)
+        return
+
+    if proxy_path not in pending_proxies:
+        pending_proxies[proxy_path] = get_executor().submit(
+            generate_proxy, bpy.app.binary_path, filepath, proxy_path,
+            proxy_size)
+
+    future = pending_proxies[proxy_path]
+    area_pointer = area.as_pointer()
+    image_name = image.name
+
+    def check_proxy():
+        if not future.done():
+            return 0.1
+
+        proxy_timers.discard(check_proxy)
+        pending_proxies.pop(proxy_path, None)
+        space = find_space(area_targets.pop(area_pointer, area_pointer))
+        image = bpy.data.images.get(image_name)
+
+        if (space is None) or (image is None):
+            return None
+
+        # Do not replace image picked by user in the meantime
+        if (space.image is not None) and (space.image != image):
+            return None
+
+        if future.exception() is not None:
+            space.image = image
+        elif future.result() is None:
+            small_images.add(filepath)
+            space.image = image
+        else:
+            space.image = load_proxy(image, proxy_path)
+
+        return None
+
+    proxy_timers.add(check_proxy)
+    bpy.app.timers.register(check_proxy, first_interval=0.1)
@@ -0,0 +1,85 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+import bpy
+from bpy.app.handlers import persistent
+
+# Mesh pointer -> revision of the last depsgraph update seen for the mesh
+revisions = {}
+
+# Caches keyed by mesh pointer, cleared when a file is loaded
+mesh_caches = []
+
+# Revisions are never reused, so pointers reused by a new file
+# never match revision stored for an old mesh
+last_revision = 0
+initial_revision = 0
+
+
+def register_cache(cache):
+    mesh_caches.append(cache)
+    return cache
+
+
+def get_revision(mesh):
+    return revisions.get(mesh.as_pointer(), initial_revision)
+
+
+def bump_revision(mesh):
+    global last_revision
+
+    last_revision += 1
+    revisions[mesh.as_pointer()] = last_revision
+
+
+@persistent
+def depsgraph_update_post(scene, depsgraph):
+    for update in depsgraph.updates:
+        update_id = update.id
+
+        if isinstance(update_id, bpy.types.Mesh):
+            bump_revision(update_id.original)
+        elif isinstance(update_id, bpy.types.Object) and \
+                update.is_updated_geometry and (update_id.type == 'MESH'):
+            bump_revision(update_id.original.data)
+
+
+@persistent
+def load_post(dummy):
+    global last_revision, initial_revision
+
+    # Pointers are not valid across files
+    revisions.clear()
+
+    for cache in mesh_caches:
+        cache.clear()
+
+    last_revision += 1
+    initial_revision = last_revision
+
+
+def register_handlers():
+    bpy.app.handlers.depsgraph_update_post.append(depsgraph_update_post)
+    bpy.app.handlers.load_post.append(load_post)
+
+
+def unregister_handlers():
+    bpy.app.handlers.depsgraph_update_post.remove(depsgraph_update_post)
+    bpy.app.handlers.load_post.remove(load_post)
@@ -0,0 +1,186 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+import cProfile
+import functools
+import os
+import pstats
+import tempfile
+import time
+
+import bpy
+
+session = None
+
+
+class ProfileSession:
+    def __init__(self, targets, limit_type, limit, on_finish):
+        self.profile = cProfile.Profile()
+        self.originals = []
+        self.limit_type = limit_type
+        self.limit = limit
+        self.on_finish = on_finish
+        self.calls = 0
+        self.depth = 0
+        self.finishing = False
+        self.finish_timer = self.finish
+
+        # Methods are patched only for the session lifetime
+        for cls, name in targets:
+            function = cls.__dict__[name]
+            self.originals.append((cls, name, function))
+            setattr(cls, name, self.wrap(function))
+
+        if limit_type == 'SECONDS':
+            bpy.app.timers.register(self.finish_timer, first_interval=limit)
+
+    def call(self, function, args):
+        # Nested calls are profiled as part of the outer one
+        self.depth += 1
+
+        if self.depth == 1:
+            self.profile.enable()
+
+        try:
+            return function(*args)
+        finally:
+            self.depth -= 1
+
+            if self.depth == 0:
+                self.profile.disable()
+                self.calls += 1
+
+                if (self.limit_type == 'CALLS') and \
+                        (self.calls == self.limit):
+                    bpy.app.timers.register(self.finish_timer)
+
+    def wrap(self, function):
+        # Blender passes callback arguments by co_argcount of the function,
+        # so wrapper must have the same positional arguments
+        argument_count = function.__code__.co_argcount
+
+        if argument_count == 2:
+            def wrapper(instance, first):
+                return self.call(function, (instance, first))
+        elif argument_count == 3:
+            def wrapper(instance, first, second):
+                return self.call(function, (instance, first, second))
+        else:
+            raise ValueError("Can not profile %s with %d arguments" %
+                             (function.__qualname__, argument_count))
+
+        return functools.wraps(function)(wrapper)
+
+    def finish(self):
+        if (session is self) and (not self.finishing):
+            self.finishing = True
+            self.on_finish()
+
+        return None
+
+    def restore(self):
+        for cls, name, function in self.originals:
+            setattr(cls, name, function)
+
+        if bpy.app.timers.is_registered(self.finish_timer):
+            bpy.app.timers.unregister(self.finish_timer)
+
+
+def get_function_label(func):
+    filename, line, name = func
+    return "%s:%d(%s)" % (os.path.basename(filename), line, name)
+
+
+def write_collapsed_stacks(stats, filepath):
+    # Rebuild call paths from caller/callee pairs,
+    # splitting function time between paths by call edge time
+    children = {}
+
+    for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+        for caller, caller_stats in callers.items():
+            children.setdefault(caller, []).append((func, caller_stats[3]))
+
+    stacks = {}
+    pending = [(func, (), 1.0) for func, value in stats.stats.items()
+               if not value[4]]
+
+    while pending:
+        func, path, weight = pending.pop()
+        cc, nc, tt, ct, callers = stats.stats[func]
+        path = path + (func,)
+        self_time = int(tt * weight * 1000000)
+
+        if self_time > 0:
+            stack = ";".join(get_function_label(item) for item in path)
+            stacks[stack] = stacks.get(stack, 0) + self_time
+
+        for child, edge_time in children.get(func, ()):
+            child_time = stats.stats[child][3]
+
+            if (child in path) or (child_time <= 0):
+                continue
+
+            pending.append((child, path, weight * edge_time / child_time))
+
+    with open(filepath, "w") as file:
+        for stack, value in sorted(stacks.items()):
+            file.write("%s %d\n" % (stack, value))
+
+
+def start_session(targets, limit_type, limit, on_finish):
+    global session
+
+    stop_session()
+    session = ProfileSession(targets, limit_type, limit, on_finish)
+
+
+def stop_session(directory=""):
+    global session
+
+    if session is None:
+        return None
+
+    finished_session = session
+    session = None
+    finished_session.restore()
+
+    if finished_session.calls == 0:
+        return None
+
+    if directory == "":
+        directory = os.path.join(tempfile.gettempdir(), "sticky_uv_editor")
+
+    os.makedirs(directory, exist_ok=True)
+    filepath = os.path.join(
+        directory, time.strftime("sticky_uv_editor_%Y%m%d_%H%M%S"))
+
+    # Sessions may finish within the same second
+    base_filepath = filepath
+    index = 1
+
+    while os.path.exists(filepath + ".pstats"):
+        filepath = "%s_%d" % (base_filepath, index)
+        index += 1
+
+    stats = pstats.Stats(finished_session.profile)
+    stats.dump_stats(filepath + ".pstats")
+    write_collapsed_stacks(stats, filepath + ".txt")
+
+    return filepath + ".pstats"
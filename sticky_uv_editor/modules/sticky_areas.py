@@ -0,0 +1,132 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+import time
+
+# Area pointer -> time when UV Editor was opened in the area
+areas = {}
+
+# Window pointer -> time when UV Editor window was opened
+windows = {}
+
+
+def tag_area(area):
+    areas[area.as_pointer()] = time.monotonic()
+
+
+def untag_area(area):
+    areas.pop(area.as_pointer(), None)
+
+
+def tag_window(window):
+    windows[window.as_pointer()] = time.monotonic()
+
+
+def is_sticky_area(area):
+    return (area is not None) and (area.ui_type == 'UV') and \
+        (area.as_pointer() in areas)
+
+
+def prune(window_manager):
+    # Only pointers are stored, forget the ones Blender has freed
+    live_windows = set()
+    live_areas = set()
+
+    for window in window_manager.windows:
+        live_windows.add(window.as_pointer())
+
+        for area in window.screen.areas:
+            if area.ui_type == 'UV':
+                live_areas.add(area.as_pointer())
+
+    for pointer in set(windows) - live_windows:
+        del windows[pointer]
+
+    for pointer in set(areas) - live_areas:
+        del areas[pointer]
+
+
+def has_view_3d_neighbour(screen, area):
+    for screen_area in screen.areas:
+        if (screen_area.ui_type != 'VIEW_3D') or (screen_area.y != area.y):
+            continue
+
+        if (abs(area.x - (screen_area.x + screen_area.width)) < 20) or \
+                (abs(screen_area.x - (area.x + area.width)) < 20):
+            return True
+
+    return False
+
+
+def estimate_area_size(area):
+    # Region draw buffers only, images shown stay loaded after closing
+    return area.width * area.height * 4
+
+
+def find_window(window_manager, pointer):
+    for window in window_manager.windows:
+        if window.as_pointer() == pointer:
+            return window
+
+    return None
+
+
+def find_area(window_manager, pointer):
+    for window in window_manager.windows:
+        for area in window.screen.areas:
+            if area.as_pointer() == pointer:
+                return window, area
+
+    return None, None
+
+
+# Return (window, area, age, size, is_orphan) of windows opened by the add-on
+# and of areas left behind, area is None for windows
+def collect_editors(window_manager, include_areas):
+    prune(window_manager)
+    now = time.monotonic()
+    editors = []
+
+    for window in window_manager.windows:
+        window_pointer = window.as_pointer()
+
+        # Window is left behind once it has no UV Editor anymore
+        if window_pointer in windows:
+            uv_areas = [area for area in window.screen.areas
+                        if area.ui_type == 'UV']
+            size = window.width * window.height * 4 + \
+                sum(estimate_area_size(area) for area in uv_areas)
+            editors.append((window, None, now - windows[window_pointer],
+                            size, not uv_areas))
+            continue
+
+        if not include_areas:
+            continue
+
+        # UV Editors which can not be toggled back to 3D Viewport
+        for area in window.screen.areas:
+            area_pointer = area.as_pointer()
+
+            if (area_pointer in areas) and \
+                    (not has_view_3d_neighbour(window.screen, area)):
+                editors.append((window, area, now - areas[area_pointer],
+                                estimate_area_size(area), True))
+
+    return editors
@@ -0,0 +1,79 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+import numpy as np
+
+from .mesh_revision import get_revision, register_cache
+
+# Mesh pointer -> (revision, occupied tiles (u, v) array)
+tile_cache = register_cache({})
+
+
+def get_occupied_tiles(obj):
+    mesh = obj.data
+    key = mesh.as_pointer()
+    revision = get_revision(mesh)
+    cached = tile_cache.get(key)
+
+    if (cached is not None) and (cached[0] == revision):
+        return cached[1]
+
+    if obj.mode == 'EDIT':
+        obj.update_from_editmode()
+
+    uv_layer = mesh.uv_layers.active
+
+    if (uv_layer is None) or (len(mesh.polygons) == 0):
+        tiles = np.empty((0, 2), dtype=np.int64)
+    else:
+        uvs = np.empty(len(uv_layer.data) * 2, dtype=np.float64)
+        uv_layer.data.foreach_get("uv", uvs)
+        loop_starts = np.empty(len(mesh.polygons), dtype=np.int64)
+        mesh.polygons.foreach_get("loop_start", loop_starts)
+        loop_totals = np.empty(len(mesh.polygons), dtype=np.int64)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+
+        # Face centers, UVs on tile border belong to the face's tile
+        centers = np.add.reduceat(uvs.reshape(-1, 2), loop_starts) / \
+            loop_totals[:, np.newaxis]
+        tiles = np.unique(np.floor(centers).astype(np.int64), axis=0)
+
+    tile_cache[key] = (revision, tiles)
+    return tiles
+
+
+def get_tile_grid_shape(objects):
+    tiles = [get_occupied_tiles(obj) for obj in objects
+             if obj.type == 'MESH']
+    tiles = [tile for tile in tiles if len(tile)]
+
+    if not tiles:
+        return (1, 1)
+
+    tiles = np.concatenate(tiles)
+
+    # UDIM tiles start at 1001 and have 10 columns per row
+    tiles = tiles[(tiles[:, 0] >= 0) & (tiles[:, 0] < 10) & (tiles[:, 1] >= 0)]
+
+    if len(tiles) == 0:
+        return (1, 1)
+
+    columns, rows = tiles.max(axis=0) + 1
+    return (int(columns), int(min(rows, 100)))
@@ -0,0 +1,220 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import bpy
+import numpy as np
+
+from .mesh_revision import get_revision, register_cache
+
+# Mesh pointer -> (revision, selected UV bounds), with UV sync selection
+# only since UV selection without sync does not tag depsgraph
+bounds_cache = register_cache({})
+
+# Names of objects to cache bounds for while UI is idle
+warm_queue = []
+
+executor = None
+
+
+def get_executor():
+    global executor
+
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+
+    return executor
+
+
+def unregister():
+    global executor
+
+    if bpy.app.timers.is_registered(warm_cache_step):
+        bpy.app.timers.unregister(warm_cache_step)
+
+    warm_queue.clear()
+
+    if executor is not None:
+        executor.shutdown(wait=False)
+        executor = None
+
+
+def is_cached(obj):
+    cached = bounds_cache.get(obj.data.as_pointer())
+    return (cached is not None) and (cached[0] == get_revision(obj.data))
+
+
+def take_snapshot(obj):
+    # Converting edit mesh is the expensive part, done on main thread
+    if obj.mode == 'EDIT':
+        obj.update_from_editmode()
+
+    mesh = obj.data
+    uv_layer = mesh.uv_layers.active
+
+    if uv_layer is None:
+        return None
+
+    loop_count = len(mesh.loops)
+    polygon_count = len(mesh.polygons)
+
+    uvs = np.empty(loop_count * 2, dtype=np.float32)
+    uv_layer.data.foreach_get("uv", uvs)
+    loop_totals = np.empty(polygon_count, dtype=np.int64)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    hidden = np.empty(polygon_count, dtype=bool)
+    mesh.polygons.foreach_get("hide", hidden)
+
+    # With UV sync selection all visible faces are shown
+    # and selection comes from mesh
+    loop_vertices = np.empty(loop_count, dtype=np.int64)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    vertex_select = np.empty(len(mesh.vertices), dtype=bool)
+    mesh.vertices.foreach_get("select", vertex_select)
+
+    return (uvs.reshape(-1, 2), loop_totals, ~hidden,
+            vertex_select[loop_vertices])
+
+
+def compute_bounds(snapshot):
+    # Runs in worker thread, must not touch bpy data
+    uvs, loop_totals, visible, loop_select = snapshot
+    selected = np.repeat(visible, loop_totals) & loop_select
+
+    if not selected.any():
+        return None
+
+    selected_uvs = uvs[selected]
+    return selected_uvs.min(axis=0), selected_uvs.max(axis=0)
+
+
+def cache_bounds(objects):
+    keys = []
+    snapshots = []
+
+    for obj in objects:
+        key = obj.data.as_pointer()
+        revision = get_revision(obj.data)
+        snapshot = take_snapshot(obj)
+
+        if snapshot is None:
+            bounds_cache[key] = (revision, None)
+            continue
+
+        keys.append((key, revision))
+        snapshots.append(snapshot)
+
+    for (key, revision), object_bounds in zip(
+            keys, get_executor().map(compute_bounds, snapshots)):
+        bounds_cache[key] = (revision, object_bounds)
+
+
+def warm_cache_step():
+    if (not warm_queue) or \
+            (not bpy.context.scene.tool_settings.use_uv_select_sync):
+        warm_queue.clear()
+        return None
+
+    # One object per step to keep UI responsive
+    obj = bpy.data.objects.get(warm_queue.pop())
+
+    if (obj is not None) and (obj.type == 'MESH') and \
+            (obj.mode == 'EDIT') and (not is_cached(obj)):
+        cache_bounds([obj])
+
+    return 0.05 if warm_queue else None
+
+
+def warm_cache(objects):
+    warm_queue[:] = [obj.name for obj in objects]
+
+    if warm_queue and not bpy.app.timers.is_registered(warm_cache_step):
+        bpy.app.timers.register(warm_cache_step, first_interval=0.5)
+
+
+def get_selected_bounds(objects):
+    cache_bounds([obj for obj in objects if not is_cached(obj)])
+    bounds = [bounds_cache[obj.data.as_pointer()][1] for obj in objects]
+    bounds = [object_bounds for object_bounds in bounds
+              if object_bounds is not None]
+
+    if not bounds:
+        return None
+
+    return (np.min([object_bounds[0] for object_bounds in bounds], axis=0),
+            np.max([object_bounds[1] for object_bounds in bounds], axis=0))
+
+
+def frame_selected(context, area, objects):
+    space = area.spaces[0]
+    region = None
+
+    for area_region in area.regions:
+        if area_region.type == 'WINDOW':
+            region = area_region
+            break
+
+    if region is None:
+        return
+
+    override = {'window': context.window,
+                'screen': context.window.screen, 'area': area,
+                'region': region}
+
+    objects = [obj for obj in objects if obj.type == 'MESH']
+    missing = [obj for obj in objects if not is_cached(obj)]
+
+    # Converting edit meshes is slower than view_selected scan of BMesh,
+    # use cached bounds only when few objects need converting
+    if (not context.scene.tool_settings.use_uv_select_sync) or \
+            (len(missing) * 2 > len(objects)):
+        bpy.ops.image.view_selected(override)
+
+        if context.scene.tool_settings.use_uv_select_sync:
+            warm_cache(missing)
+
+        return
+
+    bounds = get_selected_bounds(objects)
+
+    if bounds is None:
+        return
+
+    # Same fallback size as UV Editor uses without image
+    if (space.image is not None) and (space.image.size[0] > 0):
+        image_width, image_height = space.image.size
+    else:
+        image_width, image_height = 256, 256
+
+    (min_u, min_v), (max_u, max_v) = bounds
+    width = max(float(max_u - min_u) * image_width, 0.01)
+    height = max(float(max_v - min_v) * image_height, 0.01)
+    zoom = min(region.width / width, region.height / height) * 0.9
+
+    # Center view through 2D cursor and put the cursor back
+    cursor_location = tuple(space.cursor_location)
+    bpy.ops.uv.cursor_set(override, location=(float(min_u + max_u) * 0.5,
+                                              float(min_v + max_v) * 0.5))
+    bpy.ops.image.view_center_cursor(override)
+    space.cursor_location = cursor_location
+
+    bpy.ops.image.view_zoom_ratio(override, ratio=zoom)
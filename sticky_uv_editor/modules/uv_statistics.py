@@ -0,0 +1,302 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+from concurrent.futures import ThreadPoolExecutor
+
+import bpy
+import numpy as np
+
+from .mesh_revision import get_revision, register_cache
+
+# Mesh pointer -> (revision, statistics)
+statistics_cache = register_cache({})
+
+# Cells per side of the grid used to rasterize UVs in 0-1 tile
+COVERAGE_RESOLUTION = 256
+
+# Cell tests done at once while rasterizing
+COVERAGE_CHUNK_SIZE = 4000000
+
+# Mesh pointer -> (revision, pending statistics)
+pending_statistics = {}
+
+# Timers waiting for pending statistics
+statistics_timers = set()
+
+executor = None
+
+
+def get_executor():
+    global executor
+
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=1)
+
+    return executor
+
+
+def unregister():
+    global executor
+
+    for timer in statistics_timers:
+        if bpy.app.timers.is_registered(timer):
+            bpy.app.timers.unregister(timer)
+
+    statistics_timers.clear()
+    pending_statistics.clear()
+
+    if executor is not None:
+        executor.shutdown(wait=False)
+        executor = None
+
+
+def take_snapshot(obj):
+    if obj.mode == 'EDIT':
+        obj.update_from_editmode()
+
+    mesh = obj.data
+    uv_layer = mesh.uv_layers.active
+
+    if (uv_layer is None) or (len(mesh.polygons) == 0):
+        return None
+
+    loop_count = len(mesh.loops)
+    polygon_count = len(mesh.polygons)
+
+    uvs = np.empty(loop_count * 2, dtype=np.float64)
+    uv_layer.data.foreach_get("uv", uvs)
+    loop_vertices = np.empty(loop_count, dtype=np.int64)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    loop_starts = np.empty(polygon_count, dtype=np.int64)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_totals = np.empty(polygon_count, dtype=np.int64)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    coordinates = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+    mesh.vertices.foreach_get("co", coordinates)
+
+    return {
+        "uvs": uvs.reshape(-1, 2),
+        "loop_vertices": loop_vertices,
+        "loop_starts": loop_starts,
+        "loop_totals": loop_totals,
+        "coordinates": coordinates.reshape(-1, 3),
+        "matrix": np.array(obj.matrix_world, dtype=np.float64)
+    }
+
+
+def count_islands(polygon_count, loop_polygons, loop_vertices, uvs,
+                  next_loops):
+    # UV vertices are mesh vertices split by UV position
+    quantized_uvs = np.round(uvs * 100000).astype(np.int64)
+    uv_vertex_keys = np.column_stack((loop_vertices, quantized_uvs))
+    uv_vertices = np.unique(uv_vertex_keys, axis=0,
+                            return_inverse=True)[1].ravel()
+
+    uv_edges = np.sort(np.column_stack(
+        (uv_vertices, uv_vertices[next_loops])), axis=1)
+    edge_ids = np.unique(uv_edges, axis=0, return_inverse=True)[1].ravel()
+
+    # Faces sharing UV edge are in the same island
+    order = np.argsort(edge_ids, kind='stable')
+    shared = edge_ids[order[1:]] == edge_ids[order[:-1]]
+    polygons_a = loop_polygons[order[:-1]][shared]
+    polygons_b = loop_polygons[order[1:]][shared]
+
+    # Union-find with union by minimum root and pointer jumping
+    parent = np.arange(polygon_count)
+
+    while True:
+        roots_a = parent[polygons_a]
+        roots_b = parent[polygons_b]
+        merge = roots_a != roots_b
+
+        if not merge.any():
+            break
+
+        lowest = np.minimum(roots_a[merge], roots_b[merge])
+        np.minimum.at(parent, roots_a[merge], lowest)
+        np.minimum.at(parent, roots_b[merge], lowest)
+
+        while True:
+            grandparent = parent[parent]
+
+            if np.array_equal(grandparent, parent):
+                break
+
+            parent = grandparent
+
+    return int(np.count_nonzero(parent == np.arange(polygon_count)))
+
+
+def compute_coverage(uvs, first_loops, next_loops):
+    # Fraction of 0-1 tile cells whose centers are covered by UV triangles
+    resolution = COVERAGE_RESOLUTION
+    loops = np.arange(len(uvs))
+    fan = (loops != first_loops) & (next_loops != first_loops)
+    corners_a = uvs[first_loops[fan]] * resolution - 0.5
+    corners_b = uvs[loops[fan]] * resolution - 0.5
+    corners_c = uvs[next_loops[fan]] * resolution - 0.5
+
+    # Cells with centers inside triangle bounds
+    lower = np.minimum(np.minimum(corners_a, corners_b), corners_c)
+    upper = np.maximum(np.maximum(corners_a, corners_b), corners_c)
+    cells_min = np.clip(np.ceil(lower), 0, resolution).astype(np.int64)
+    cells_max = np.clip(np.floor(upper), -1, resolution - 1).astype(np.int64)
+    widths = np.maximum(cells_max[:, 0] - cells_min[:, 0] + 1, 0)
+    heights = np.maximum(cells_max[:, 1] - cells_min[:, 1] + 1, 0)
+    counts = widths * heights
+
+    covered = np.zeros(resolution * resolution, dtype=bool)
+    ends = np.cumsum(counts)
+    start = 0
+
+    while start < len(counts):
+        end = max(int(np.searchsorted(
+            ends, ends[start] - counts[start] + COVERAGE_CHUNK_SIZE,
+            side='right')), start + 1)
+        chunk_counts = counts[start:end]
+        triangles = np.repeat(np.arange(start, end), chunk_counts)
+        offsets = np.arange(len(triangles)) - np.repeat(
+            np.cumsum(chunk_counts) - chunk_counts, chunk_counts)
+        cells_x = cells_min[triangles, 0] + offsets % widths[triangles]
+        cells_y = cells_min[triangles, 1] + offsets // widths[triangles]
+        points = np.column_stack((cells_x, cells_y)).astype(np.float64)
+
+        # Same side of all edges, any winding
+        sides = []
+
+        for corner, next_corner in ((corners_a, corners_b),
+                                    (corners_b, corners_c),
+                                    (corners_c, corners_a)):
+            edges = next_corner[triangles] - corner[triangles]
+            offsets_to_point = points - corner[triangles]
+            sides.append(edges[:, 0] * offsets_to_point[:, 1] -
+                         edges[:, 1] * offsets_to_point[:, 0])
+
+        sides = np.column_stack(sides)
+        inside = np.all(sides >= 0, axis=1) | np.all(sides <= 0, axis=1)
+        covered[cells_y[inside] * resolution + cells_x[inside]] = True
+        start = end
+
+    return float(np.count_nonzero(covered)) / covered.size
+
+
+def compute_statistics(snapshot):
+    # Runs in worker thread, must not touch bpy data
+    uvs = snapshot["uvs"]
+    loop_vertices = snapshot["loop_vertices"]
+    loop_starts = snapshot["loop_starts"]
+    loop_totals = snapshot["loop_totals"]
+    matrix = snapshot["matrix"]
+
+    coordinates = snapshot["coordinates"] @ matrix[:3, :3].T + matrix[:3, 3]
+    polygon_count = len(loop_starts)
+    loop_polygons = np.repeat(np.arange(polygon_count), loop_totals)
+    first_loops = loop_starts[loop_polygons]
+    next_loops = np.arange(len(loop_vertices)) + 1
+    next_loops[loop_starts + loop_totals - 1] = loop_starts
+
+    # Face areas as sum of triangle fan areas
+    loop_coordinates = coordinates[loop_vertices]
+    edges_a = loop_coordinates - loop_coordinates[first_loops]
+    edges_b = loop_coordinates[next_loops] - loop_coordinates[first_loops]
+    face_areas = np.linalg.norm(np.add.reduceat(
+        np.cross(edges_a, edges_b), loop_starts), axis=1) * 0.5
+
+    uv_edges_a = uvs - uvs[first_loops]
+    uv_edges_b = uvs[next_loops] - uvs[first_loops]
+    uv_areas = np.abs(np.add.reduceat(
+        uv_edges_a[:, 0] * uv_edges_b[:, 1] -
+        uv_edges_a[:, 1] * uv_edges_b[:, 0], loop_starts)) * 0.5
+
+    # Texel density in UV units per scene unit
+    valid = face_areas > 1e-12
+    densities = np.sqrt(uv_areas[valid] / face_areas[valid])
+    total_area = face_areas[valid].sum()
+
+    return {
+        "islands": count_islands(polygon_count, loop_polygons,
+                                 loop_vertices, uvs, next_loops),
+        "coverage": compute_coverage(uvs, first_loops, next_loops),
+        "uv_area": float(uv_areas.sum()),
+        "density_min": float(densities.min()) if len(densities) else 0.0,
+        "density_mean": float(np.sqrt(uv_areas[valid].sum() / total_area))
+        if total_area > 0 else 0.0,
+        "density_max": float(densities.max()) if len(densities) else 0.0
+    }
+
+
+def get_statistics(mesh):
+    cached = statistics_cache.get(mesh.as_pointer())
+
+    if cached is None:
+        return None, False
+
+    return cached[1], cached[0] == get_revision(mesh)
+
+
+def is_pending(mesh):
+    return mesh.as_pointer() in pending_statistics
+
+
+def redraw_uv_editors():
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.ui_type == 'UV':
+                area.tag_redraw()
+
+
+def request_statistics(obj, force=False):
+    mesh = obj.data
+    key = mesh.as_pointer()
+
+    if key in pending_statistics:
+        return
+
+    revision = get_revision(mesh)
+    cached = statistics_cache.get(key)
+
+    if (not force) and (cached is not None) and (cached[0] == revision):
+        return
+
+    snapshot = take_snapshot(obj)
+
+    if snapshot is None:
+        statistics_cache.pop(key, None)
+        return
+
+    future = get_executor().submit(compute_statistics, snapshot)
+    pending_statistics[key] = (revision, future)
+
+    def check_statistics():
+        if not future.done():
+            return 0.1
+
+        statistics_timers.discard(check_statistics)
+        pending_statistics.pop(key, None)
+
+        if future.exception() is None:
+            statistics_cache[key] = (revision, future.result())
+
+        redraw_uv_editors()
+        return None
+
+    statistics_timers.add(check_statistics)
+    bpy.app.timers.register(check_statistics, first_interval=0.1)
@@ -141,7 +141,12 @@ class UVEditorSettings(PropertyGroup):
         self.show_modified_edges = uv_editor.show_modified_edges
         self.show_faces = uv_editor.show_faces
         self.show_metadata = uv_editor.show_metadata
-        self.tile_grid_shape = uv_editor.tile_grid_shape
+
+        # Keep user grid shape, automatic one is computed on every open
+        addon_prefs = bpy.context.preferences.addons[__package__].preferences
+
+        if not addon_prefs.use_auto_tile_grid:
+            self.tile_grid_shape = uv_editor.tile_grid_shape
 
         if self.app_version >= (3, 0, 0):
             self.use_custom_grid = uv_editor.use_custom_grid
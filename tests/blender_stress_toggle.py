@@ -0,0 +1,69 @@
+# Toggle Sticky UV Editor many times in a real Blender session and check
+# that areas, windows and the add-on registry do not grow. Needs a window,
+# so run without --background (Blender 3.2+ for context.temp_override):
+#
+#   blender --factory-startup --python-exit-code 1 \
+#       --python tests/blender_stress_toggle.py
+
+import os
+import sys
+
+import addon_utils
+import bpy
+
+CYCLES = 1000
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+
+def find_area(window, ui_type):
+    for area in window.screen.areas:
+        if area.ui_type == ui_type:
+            return area
+
+    return None
+
+
+def toggle(window, area):
+    region = None
+
+    for area_region in area.regions:
+        if area_region.type == 'WINDOW':
+            region = area_region
+            break
+
+    with bpy.context.temp_override(window=window, screen=window.screen,
+                                   area=area, region=region):
+        bpy.ops.wm.sticky_uv_editor('INVOKE_DEFAULT')
+
+
+def count_editors(window_manager):
+    return (len(window_manager.windows),
+            sum(len(window.screen.areas) for window in window_manager.windows))
+
+
+def main():
+    addon_utils.enable("sticky_uv_editor", default_set=True)
+    from sticky_uv_editor.modules import sticky_areas
+
+    window_manager = bpy.context.window_manager
+    window = window_manager.windows[0]
+    before = count_editors(window_manager)
+
+    for cycle in range(CYCLES):
+        toggle(window, find_area(window, 'VIEW_3D'))
+        assert find_area(window, 'UV') is not None, \
+            "UV Editor not opened in cycle %d" % cycle
+
+        toggle(window, find_area(window, 'UV'))
+        assert count_editors(window_manager) == before, \
+            "Editor count changed in cycle %d" % cycle
+
+    sticky_areas.prune(window_manager)
+    assert len(sticky_areas.areas) == 0
+    assert len(sticky_areas.windows) == 0
+    print("Sticky UV Editor: %d toggle cycles passed" % CYCLES)
+
+
+main()
+bpy.ops.wm.quit_blender()
@@ -0,0 +1,135 @@
+import importlib.util
+import itertools
+import os
+
+import pytest
+
+MODULE_PATH = os.path.join(os.path.dirname(__file__), os.pardir,
+                           "sticky_uv_editor", "modules", "sticky_areas.py")
+
+pointers = itertools.count(1)
+
+
+def load_sticky_areas():
+    # Module does not use bpy, load it without the add-on package
+    spec = importlib.util.spec_from_file_location("sticky_areas", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class Area:
+    def __init__(self, ui_type, x, width, y=0, height=500):
+        self.pointer = next(pointers)
+        self.ui_type = ui_type
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    def as_pointer(self):
+        return self.pointer
+
+
+class Screen:
+    def __init__(self, areas):
+        self.areas = areas
+
+
+class Window:
+    def __init__(self, areas, width=1000, height=500):
+        self.pointer = next(pointers)
+        self.screen = Screen(areas)
+        self.width = width
+        self.height = height
+
+    def as_pointer(self):
+        return self.pointer
+
+
+class WindowManager:
+    def __init__(self, windows):
+        self.windows = windows
+
+
+@pytest.fixture
+def sticky_areas():
+    return load_sticky_areas()
+
+
+def test_toggle_cycles_keep_registry_flat(sticky_areas):
+    view_3d = Area('VIEW_3D', 0, 1000)
+    window_manager = WindowManager([Window([view_3d])])
+    screen = window_manager.windows[0].screen
+
+    for _ in range(1000):
+        # Open: split 3D Viewport and turn one half into UV Editor
+        view_3d.width = 500
+        uv_area = Area('UV', 501, 500)
+        screen.areas.append(uv_area)
+        sticky_areas.prune(window_manager)
+        sticky_areas.tag_area(uv_area)
+
+        # Close: save settings, untag and join back
+        sticky_areas.untag_area(uv_area)
+        screen.areas.remove(uv_area)
+        view_3d.width = 1000
+
+        assert len(screen.areas) == 1
+        assert len(window_manager.windows) == 1
+        assert len(sticky_areas.areas) == 0
+
+    assert sticky_areas.collect_editors(window_manager, True) == []
+
+
+def test_alt_toggle_cycles_keep_registry_flat(sticky_areas):
+    window_manager = WindowManager([Window([Area('VIEW_3D', 0, 1000)])])
+
+    for _ in range(1000):
+        window = Window([Area('UV', 0, 1000)])
+        window_manager.windows.append(window)
+        sticky_areas.tag_window(window)
+        sticky_areas.tag_area(window.screen.areas[0])
+
+        # User closes the window
+        window_manager.windows.remove(window)
+        sticky_areas.prune(window_manager)
+
+        assert len(window_manager.windows) == 1
+        assert len(sticky_areas.windows) == 0
+        assert len(sticky_areas.areas) == 0
+
+
+def test_live_window_is_not_orphan(sticky_areas):
+    uv_area = Area('UV', 0, 1000)
+    window = Window([uv_area])
+    window_manager = WindowManager([Window([Area('VIEW_3D', 0, 1000)]),
+                                    window])
+    sticky_areas.tag_window(window)
+    sticky_areas.tag_area(uv_area)
+
+    editors = sticky_areas.collect_editors(window_manager, True)
+    assert [(item[0], item[1], item[4]) for item in editors] == \
+        [(window, None, False)]
+
+    # Window is left behind once its UV Editor is switched away
+    uv_area.ui_type = 'VIEW_3D'
+    editors = sticky_areas.collect_editors(window_manager, True)
+    assert [(item[0], item[1], item[4]) for item in editors] == \
+        [(window, None, True)]
+    assert len(sticky_areas.areas) == 0
+
+
+def test_area_without_view_3d_neighbour_is_orphan(sticky_areas):
+    view_3d = Area('VIEW_3D', 0, 500)
+    uv_area = Area('UV', 501, 500)
+    window_manager = WindowManager([Window([view_3d, uv_area])])
+    sticky_areas.tag_area(uv_area)
+
+    assert sticky_areas.collect_editors(window_manager, True) == []
+
+    # 3D Viewport next to UV Editor switched to another editor
+    view_3d.ui_type = 'OUTLINER'
+    editors = sticky_areas.collect_editors(window_manager, True)
+    assert [(item[1], item[4]) for item in editors] == [(uv_area, True)]
+    assert sticky_areas.collect_editors(window_manager, False) == []